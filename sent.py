@@ -2,25 +2,32 @@
 
 from ens.utils import ChecksumAddress
 import flask
-import string
 import time
 import oxenc
 import sqlite3
 import re
 import nacl.hash
 import nacl.bindings as sodium
+import nacl.exceptions
 import eth_utils
 import subprocess
 import config
-import datetime
+import logging
+import threading
+import queue
 
-from typing           import Callable, Dict, Any, Union, cast
-from functools        import partial
+from typing             import Callable, Dict, Any, Union, cast
+from functools          import partial, lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from werkzeug.routing import BaseConverter
-from nacl.signing     import VerifyKey
 from omq              import FutureJSON, omq_connection
 from timer            import timer
 
+try:
+    import orjson
+except ModuleNotFoundError:
+    orjson = None  # fall back to flask's stdlib-json provider
+
 from contracts.reward_rate_pool                  import RewardRatePoolInterface
 from contracts.service_node_contribution         import ContributorContractInterface
 from contracts.service_node_contribution_factory import ServiceNodeContributionFactory
@@ -104,6 +111,16 @@ class App(flask.Flask):
             CREATE UNIQUE INDEX IF NOT EXISTS registration_pk_multi_idx ON registrations(pubkey_ed25519, contract IS NULL);
         """)
 
+        # The registration lookup endpoints select by operator/pubkey ordered by timestamp DESC;
+        # these composite indexes let SQLite walk the rows already in order instead of sorting.
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS registrations_operator_ts_idx ON registrations(operator, timestamp DESC);
+        """)
+
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS registrations_pubkey_ts_idx ON registrations(pubkey_ed25519, timestamp DESC);
+        """)
+
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS contribution_contracts (
                 id INTEGER PRIMARY KEY NOT NULL,
@@ -118,25 +135,82 @@ class App(flask.Flask):
         cursor.execute("""
             CREATE UNIQUE INDEX IF NOT EXISTS contribution_contract_address_idx ON contribution_contracts(contract_address);
          """)
+
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS contract_event_sync (
+                id INTEGER PRIMARY KEY CHECK (id = 0), /* single row table */
+                last_block INTEGER NOT NULL
+            );
+        """)
         cursor.close()
         sql.close()
 
+class HexJSONProvider(flask.json.provider.DefaultJSONProvider):
+    """
+    JSON provider that serializes any `bytes` values as their str hex representation.  Doing this
+    at serialization time walks the response tree exactly once, rather than needing a separate
+    recursive hexify pass (and mutation) before handing the tree to the encoder.
+    """
+
+    @staticmethod
+    def default(o):
+        if isinstance(o, (bytes, bytearray)):
+            return o.hex()
+        return flask.json.provider.DefaultJSONProvider.default(o)
+
+
 app = App()
+app.json = HexJSONProvider(app)
+
+# Timestamp log lines in the logging formatter rather than formatting datetime.now() by hand in
+# every timer callback; %(asctime)s is considerably cheaper than a strftime('%f') per message.
+flask.logging.default_handler.setFormatter(logging.Formatter(
+    "%(asctime)s.%(msecs)03d %(levelname)s %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
+))
+
+# Small pool of SQLite connections recycled across requests and timer callbacks.  Opening a fresh
+# connection per request re-pays the open/close cost and pragma setup every time; instead each
+# connection is configured once (WAL so readers don't block behind the timer writers) and returned
+# to the pool when the request context tears down.
+SQL_POOL_SIZE = 8
+_sql_pool: queue.Queue = queue.Queue(maxsize=SQL_POOL_SIZE)
+
+def open_sql():
+    sql    = sqlite3.connect(config.sqlite_db, check_same_thread=False)
+    cursor = sql.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+    return sql
 
 def get_sql():
-    if "db" not in flask.g:
-        flask.g.sql = sqlite3.connect(config.sqlite_db)
+    if "sql" not in flask.g:
+        try:
+            flask.g.sql = _sql_pool.get_nowait()
+        except queue.Empty:
+            flask.g.sql = open_sql()
     return flask.g.sql
 
-def date_now_str() -> str:
-    result = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]
-    return result
+@app.teardown_appcontext
+def release_sql(exception):
+    sql = flask.g.pop("sql", None)
+    if sql is not None:
+        try:
+            _sql_pool.put_nowait(sql)
+        except queue.Full:
+            sql.close()
+
+# Route converter patterns, built once at module scope; the converters hand Werkzeug the pattern
+# source strings, which it compiles into the routing map a single time.
+hex64_regex = "[0-9a-fA-F]{64}"
+
 
 # Validates that input is 64 hex bytes and converts it to 32 bytes.
 class Hex64Converter(BaseConverter):
     def __init__(self, url_map):
         super().__init__(url_map)
-        self.regex = "[0-9a-fA-F]{64}"
+        self.regex = hex64_regex
 
     def to_python(self, value):
         return bytes.fromhex(value)
@@ -154,6 +228,16 @@ class EthConverter(BaseConverter):
         self.regex = eth_regex
 
 
+# Like EthConverter, but converts the address to its 20-byte binary form (the form stored in the
+# database), following the same pattern as Hex64Converter.
+class EthBytesConverter(EthConverter):
+    def to_python(self, value):
+        return bytes.fromhex(value[2:])
+
+    def to_url(self, value):
+        return eth_format(value)
+
+
 b58 = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
 oxen_wallet_regex = (
     f"T[{b58}]{{96}}" if config.testnet
@@ -163,6 +247,9 @@ oxen_wallet_regex = (
 )
 
 
+either_wallet_regex = f"{eth_regex}|{oxen_wallet_regex}"
+
+
 class OxenConverter(BaseConverter):
     def __init__(self, url_map):
         super().__init__(url_map)
@@ -172,13 +259,14 @@ class OxenConverter(BaseConverter):
 class OxenEthConverter(BaseConverter):
     def __init__(self, url_map):
         super().__init__(url_map)
-        self.regex = f"{eth_regex}|{oxen_wallet_regex}"
+        self.regex = either_wallet_regex
 
 
-app.url_map.converters["hex64"]         = Hex64Converter
-app.url_map.converters["eth_wallet"]    = EthConverter
-app.url_map.converters["oxen_wallet"]   = OxenConverter
-app.url_map.converters["either_wallet"] = OxenEthConverter
+app.url_map.converters["hex64"]            = Hex64Converter
+app.url_map.converters["eth_wallet"]       = EthConverter
+app.url_map.converters["eth_wallet_bytes"] = EthBytesConverter
+app.url_map.converters["oxen_wallet"]      = OxenConverter
+app.url_map.converters["either_wallet"]    = OxenEthConverter
 
 
 def get_sns_future(omq, oxend) -> FutureJSON:
@@ -215,54 +303,23 @@ def get_sns_future(omq, oxend) -> FutureJSON:
         },
     )
 
-def get_sns(sns_future, info_future):
-    info = info_future.get()
+def get_sns():
+    """
+    Partitions the current service node list into awaiting/active/inactive lists.  The per-node
+    contribution/decommission fields are precomputed by `fetch_service_nodes` on its timer, so
+    this just reads them.
+    """
     awaiting_sns, active_sns, inactive_sns = [], [], []
-    sn_states = sns_future.get()
-    sn_states = (
-        sn_states["service_node_states"] if "service_node_states" in sn_states else []
-    )
-    for sn in sn_states:
-        sn["contribution_open"] = sn["staking_requirement"] - sn["total_reserved"]
-        sn["contribution_required"] = (
-            sn["staking_requirement"] - sn["total_contributed"]
-        )
-        sn["num_contributions"] = sum(
-            len(x["locked_contributions"])
-            for x in sn["contributors"]
-            if "locked_contributions" in x
-        )
-
+    for sn in app.nodes:
         if sn["active"]:
             active_sns.append(sn)
         elif sn["funded"]:
-            sn["decomm_blocks_remaining"] = max(sn["earned_downtime_blocks"], 0)
-            sn["decomm_blocks"] = info["height"] - sn["state_height"]
             inactive_sns.append(sn)
         else:
             awaiting_sns.append(sn)
     return awaiting_sns, active_sns, inactive_sns
 
 
-def hexify(container):
-    """
-    Takes a dict or list and mutates it to change any `bytes` values in it to str hex representation
-    of the bytes, recursively.
-    """
-    if isinstance(container, dict):
-        it = container.items()
-    elif isinstance(container, list):
-        it = enumerate(container)
-    else:
-        return
-
-    for i, v in it:
-        if isinstance(v, bytes):
-            container[i] = v.hex()
-        else:
-            hexify(v)
-
-
 # FIXME: this staking requirement value is just a placeholder for now.  We probably also want to
 # expose and retrieve this from oxend rather than hard coding it here.
 MAX_STAKE = 120_000000000
@@ -271,7 +328,31 @@ MAX_STAKERS = 10
 TOKEN_NAME = "SENT"
 
 
+# `get_info()` gets called by `json_response` for every endpoint return; cache the assembled dict
+# briefly so that bursts of concurrent requests share one oxend round trip instead of each paying
+# for their own, and remember it on `flask.g` so one response never builds it twice.
+INFO_CACHE_SECONDS = 1.0
+
+_info_cache      = {"expiry": 0.0, "info": None}
+_info_cache_lock = threading.Lock()
+
 def get_info():
+    if flask.has_app_context() and "network_info" in flask.g:
+        return flask.g.network_info
+
+    with _info_cache_lock:
+        info = _info_cache["info"]
+        if info is None or time.monotonic() >= _info_cache["expiry"]:
+            info                  = fetch_info()
+            _info_cache["info"]   = info
+            _info_cache["expiry"] = time.monotonic() + INFO_CACHE_SECONDS
+
+    if flask.has_app_context():
+        flask.g.network_info = info
+    return info
+
+
+def fetch_info():
     omq, oxend = omq_connection()
     info = FutureJSON(omq, oxend, "rpc.get_info").get()
 
@@ -304,120 +385,177 @@ def get_info():
     return result
 
 
+def _bytes_to_hex(o):
+    if isinstance(o, (bytes, bytearray)):
+        return o.hex()
+    raise TypeError
+
+
 def json_response(vals):
     """
     Takes a dict, adds some general info fields to it, and jsonifies it for a flask route function
-    return value.  The dict gets passed through `hexify` first to convert any bytes values to hex.
+    return value.  Any bytes values are serialized as hex.  Serialization goes through orjson when
+    available (it emits compact UTF-8 bytes directly and is several times faster than stdlib json
+    on the large SN list payloads), falling back to `HexJSONProvider` otherwise.
     """
 
-    hexify(vals)
+    payload = {**vals, "network": get_info(), "t": time.time()}
+    if orjson is not None:
+        return flask.Response(orjson.dumps(payload, default=_bytes_to_hex), mimetype="application/json")
+    return flask.jsonify(payload)
 
-    return flask.jsonify({**vals, "network": get_info(), "t": time.time()})
+INSERT_CONTRIBUTION_CONTRACT_SQL = """
+    INSERT INTO contribution_contracts (contract_address) VALUES (?)
+    ON CONFLICT (contract_address) DO NOTHING
+"""
 
 @timer(10, target="worker1")
 def fetch_contribution_contracts(signum):
-    app.logger.warning("{} Fetch contribution contracts start".format(date_now_str()))
+    app.logger.warning("Fetch contribution contracts start")
     with app.app_context(), get_sql() as sql:
-        cursor = sql.cursor()
+        cursor  = sql.cursor()
+        factory = app.service_node_contribution_factory
+
+        # Resume the log scan from the last block we processed (persisted across restarts so we
+        # don't re-scan the whole chain history on startup); re-scanning a block boundary twice is
+        # harmless since the inserts are deduplicated on contract address.
+        if factory.last_contribution_event_height == 0:
+            cursor.execute("SELECT last_block FROM contract_event_sync WHERE id = 0")
+            row = cursor.fetchone()
+            if row is not None:
+                factory.last_contribution_event_height = row[0]
+
+        new_contracts = factory.get_latest_contribution_contract_events()
+
+        # One prepared statement + bind/step loop instead of one execute() per event
+        cursor.executemany(
+            INSERT_CONTRIBUTION_CONTRACT_SQL,
+            ((event.args.contributorContract,) for event in new_contracts),
+        )
+        cursor.execute(
+            """
+            INSERT INTO contract_event_sync (id, last_block) VALUES (0, ?)
+            ON CONFLICT (id) DO UPDATE SET last_block = excluded.last_block
+            """,
+            (factory.last_contribution_event_height,),
+        )
+        sql.commit()
+    app.logger.warning("Fetch contribution contracts finish")
 
-        new_contracts = app.service_node_contribution_factory.get_latest_contribution_contract_events()
+def fetch_contract_details(contract_address):
+    """
+    Fetches the status/details of one contribution contract over RPC, returning the details dict
+    stored in `app.contracts` along with the contributor addresses.
+    """
+    contract_interface = app.service_node_contribution.get_contract_instance(contract_address)
+
+    # Fetch statuses and other details
+    is_finalized        = contract_interface.is_finalized()
+    is_cancelled        = contract_interface.is_cancelled()
+    bls_pubkey          = contract_interface.get_bls_pubkey()
+    service_node_params = contract_interface.get_service_node_params()
+    #contributor_addresses = contract_interface.get_contributor_addresses()
+    total_contributions = contract_interface.total_contribution()
+    contributions       = contract_interface.get_individual_contributions()
+
+    details = {
+        'finalized': is_finalized,
+        'cancelled': is_cancelled,
+        'bls_pubkey': bls_pubkey,
+        'fee': service_node_params['fee'],
+        'service_node_pubkey': service_node_params['serviceNodePubkey'],
+        'service_node_signature': service_node_params['serviceNodeSignature'],
+        'contributions': [
+            {"address": addr, "amount": amt} for addr, amt in contributions.items()
+        ],
+        'total_contributions': total_contributions,
+    }
 
-        for event in new_contracts:
-            contract_address = event.args.contributorContract
-            cursor.execute(
-                """
-                INSERT INTO contribution_contracts (contract_address) VALUES (?)
-                ON CONFLICT (contract_address) DO NOTHING
-                """,
-                (contract_address,)
-            )
-        sql.commit()
-    app.logger.warning("{} Fetch contribution contracts finish".format(date_now_str()))
+    return contract_address, details, list(contributions.keys())
 
 @timer(30)
 def fetch_contract_statuses(signum):
-    app.logger.warning("{} Update Contract Statuses Start".format(date_now_str()))
+    app.logger.warning("Update Contract Statuses Start")
     with app.app_context(), get_sql() as sql:
         cursor = sql.cursor()
         cursor.execute("SELECT contract_address FROM contribution_contracts")
         contract_addresses = cursor.fetchall()
-        app.contributors = {}
-        app.contracts = {}
-
-        for (contract_address,) in contract_addresses:
-            contract_interface = app.service_node_contribution.get_contract_instance(contract_address)
-
-            # Fetch statuses and other details
-            is_finalized        = contract_interface.is_finalized()
-            is_cancelled        = contract_interface.is_cancelled()
-            bls_pubkey          = contract_interface.get_bls_pubkey()
-            service_node_params = contract_interface.get_service_node_params()
-            #contributor_addresses = contract_interface.get_contributor_addresses()
-            total_contributions = contract_interface.total_contribution()
-            contributions       = contract_interface.get_individual_contributions()
-
-            app.contracts[contract_address] = {
-                'finalized': is_finalized,
-                'cancelled': is_cancelled,
-                'bls_pubkey': bls_pubkey,
-                'fee': service_node_params['fee'],
-                'service_node_pubkey': service_node_params['serviceNodePubkey'],
-                'service_node_signature': service_node_params['serviceNodeSignature'],
-                'contributions': [
-                    {"address": addr, "amount": amt} for addr, amt in contributions.items()
-                ],
-                'total_contributions': total_contributions,
-            }
+        contributors = {}
+        contracts = {}
+
+        # The six RPC calls per contract are I/O bound, so fan the contracts out across a thread
+        # pool and overlap the round trips rather than serializing them.
+        with ThreadPoolExecutor(max_workers=32) as executor:
+            results = executor.map(
+                fetch_contract_details,
+                (contract_address for (contract_address,) in contract_addresses),
+            )
 
-            for address in contributions.keys():
-                wallet_key = eth_format(address)
-                if address not in app.contributors:
-                    app.contributors[wallet_key] = []
-                if contract_address not in app.contributors[wallet_key]:
-                    app.contributors[wallet_key].append(contract_address)
+            for contract_address, details, contributor_addresses in results:
+                contracts[contract_address] = details
 
-    app.logger.warning("{} Update Contract Statuses Finish".format(date_now_str()))
+                for address in contributor_addresses:
+                    wallet_key = eth_format(address)
+                    if wallet_key not in contributors:
+                        contributors[wallet_key] = []
+                    if contract_address not in contributors[wallet_key]:
+                        contributors[wallet_key].append(contract_address)
+
+        # Swap in the fresh maps at once so request handlers never see a half-built state
+        app.contracts    = contracts
+        app.contributors = contributors
+
+    app.logger.warning("Update Contract Statuses Finish")
 
 @timer(10)
 def fetch_service_nodes(signum):
-    app.logger.warning("{} Update Service Nodes Start".format(date_now_str()))
+    app.logger.warning("Update Service Nodes Start")
     omq, oxend            = omq_connection()
     app.nodes             = get_sns_future(omq, oxend).get()["service_node_states"]
     app.node_contributors = {}
 
+    height = get_info()["block_height"]
+
     for index, node in enumerate(app.nodes):
-        contributors = {c["address"]: c["amount"] for c in node["contributors"]}
+        # Precompute the derived per-node fields here, once per refresh, rather than per request
+        node["contribution_open"]     = node["staking_requirement"] - node["total_reserved"]
+        node["contribution_required"] = node["staking_requirement"] - node["total_contributed"]
+        node["num_contributions"]     = sum(
+            len(x["locked_contributions"])
+            for x in node["contributors"]
+            if "locked_contributions" in x
+        )
+        if not node["active"] and node["funded"]:
+            node["decomm_blocks_remaining"] = max(node["earned_downtime_blocks"], 0)
+            node["decomm_blocks"]           = height - node["state_height"]
 
-        for address_key in contributors.keys():
-            wallet_key = address_key
-            if len(address_key) == 40:
+        for contributor in node["contributors"]:
+            wallet_key = contributor["address"]
+            if len(wallet_key) == 40:
                 wallet_key = eth_format(wallet_key)
 
             if wallet_key not in app.node_contributors:
                 app.node_contributors[wallet_key] = []
-            app.node_contributors[wallet_key].append(index)
-
-    # Reset state and re-populate it
-    app.sn_map = {}
-
-    # Creating (Binary SN key_ed25519 -> oxen.rpc.service_node_states) table
-    for node in app.nodes:
-        service_node_pubkey_hex         = node['service_node_pubkey']
-        service_node_pubkey             = bytes.fromhex(service_node_pubkey_hex)
-        app.sn_map[service_node_pubkey] = node
+            # Record the contributed balance alongside the node index so the wallet endpoint
+            # doesn't have to rebuild a contributor->amount dict per node per request.
+            app.node_contributors[wallet_key].append((index, contributor["amount"]))
+
+    # Rebuild the (Binary SN key_ed25519 -> oxen.rpc.service_node_states) table and swap it in
+    # at once so concurrent pubkey lookups never see a half-populated map.
+    app.sn_map = {
+        bytes.fromhex(node['service_node_pubkey']): node for node in app.nodes
+    }
 
     # Get the accrued rewards values for each wallet
     accrued_rewards_json = oxen_rpc_get_accrued_rewards(omq, oxend).get()
     if accrued_rewards_json['status'] != 'OK':
-        app.logger.warning("{} Update SN early exit, accrued rewards request failed: {}".format(
-                         date_now_str(),
+        app.logger.warning("Update SN early exit, accrued rewards request failed: {}".format(
                          accrued_rewards_json))
         return
 
     balances_key = 'balances'
     if balances_key not in accrued_rewards_json:
-        app.logger.warning("{} Update SN early exit, accrued rewards request failed, 'balances' key was missing: {}".format(
-                         date_now_str(),
+        app.logger.warning("Update SN early exit, accrued rewards request failed, 'balances' key was missing: {}".format(
                          accrued_rewards_json))
         return
 
@@ -441,7 +579,7 @@ def fetch_service_nodes(signum):
         # TODO It appears that doing the contract call is quite slow.
         app.wallet_map[address_key].rewards = rewards
 
-    app.logger.warning("{} Update SN finished".format(date_now_str()))
+    app.logger.warning("Update SN finished")
 
 @app.route("/info")
 def network_info():
@@ -488,19 +626,16 @@ def get_rewards_dict_for_wallet(eth_wal):
   # DEREGISTERED = 'Deregistered',
   # VOLUNTARY_DEREGISTRATION = 'Voluntary Deregistration',
 # }
-@app.route("/nodes/<oxen_wallet:oxen_wal>")
-@app.route("/nodes/<eth_wallet:eth_wal>")
-def get_nodes_for_wallet(oxen_wal=None, eth_wal=None):
-    assert oxen_wal is not None or eth_wal is not None
-    wallet_str  = eth_format(eth_wal) if eth_wal is not None else oxen_wal
+@app.route("/nodes/<either_wallet:wallet>")
+def get_nodes_for_wallet(wallet):
+    wallet_str = eth_format(wallet) if wallet.startswith("0x") else wallet
 
     sns   = []
     nodes = []
     if hasattr(app, 'node_contributors') and wallet_str in app.node_contributors:
-        for index in app.node_contributors[wallet_str]:
+        for index, balance in app.node_contributors[wallet_str]:
             node    = app.nodes[index]
             sns.append(node)
-            balance = {c["address"]: c["amount"] for c in node["contributors"]}.get(wallet_str, 0)
             state   = 'Decommissioned' if not node["active"] and node["funded"] else 'Running'
             nodes.append({
                 'balance':                 balance,
@@ -637,15 +772,25 @@ def get_liquidation(ed25519_pubkey: bytes):
 # whitespace.  Both regular and "URL-safe" base64 are accepted.  Padding is optional for base64
 # values.  Throws ParseError if the input is invalid or of the wrong size.  `length` must be at
 # least 5 (smaller byte values are harder or even ambiguous to distinguish between hex and base64).
+# Per-length constants for decode_bytes -- the compiled hex pattern and the expected hex/base64
+# input lengths -- computed once per distinct byte length (only a handful are ever used).
+@lru_cache(maxsize=None)
+def _decode_bytes_params(length):
+    hex_len = length * 2
+    return (
+        re.compile(f"[0-9a-fA-F]{{{hex_len}}}"),
+        hex_len,
+        (length * 4 + 2) // 3,  # unpadded base64 length
+        (length + 2) // 3 * 4,  # padded base64 length
+    )
+
+
 def decode_bytes(k, x, length):
     assert length >= 5
 
-    hex_len = length * 2
-    b64_unpadded = (length * 4 + 2) // 3
-    b64_padded = (length + 2) // 3 * 4
+    hex_pattern, hex_len, b64_unpadded, b64_padded = _decode_bytes_params(length)
 
-    print(f"DEBGUG: {len(x)}, {hex_len}")
-    if len(x) == hex_len and all(c in string.hexdigits for c in x):
+    if hex_pattern.fullmatch(x):
         return bytes.fromhex(x)
     if len(x) in (b64_unpadded, b64_padded):
         if oxenc.is_base64(x):
@@ -661,14 +806,14 @@ def byte_decoder(length: int):
     return partial(decode_bytes, length=length)
 
 
+# Matches a non-empty, non-0-prefixed, non-whitespace-padded decimal integer:
+_int_pattern = re.compile(r"0|[1-9][0-9]*")
+
+
 # Takes a positive integer value required to be between irange[0] and irange[1], inclusive.  The
 # integer may not be 0-prefixed or whitespace padded.
 def parse_int_field(k, v, irange):
-    if (
-        len(v) == 0
-        or not all(c in "0123456789" for c in v)
-        or (len(v) > 1 and v[0] == "0")
-    ):
+    if not _int_pattern.fullmatch(v):
         raise ParseError(k, "an integer value is required")
     v = int(v)
     imin, imax = irange
@@ -677,17 +822,42 @@ def parse_int_field(k, v, irange):
     raise ParseError(k, f"expected an integer between {imin} and {imax}")
 
 
+_eth_pattern = re.compile(eth_regex)
+
+
+# The EIP-55 check inside eth_utils.is_address keccak-hashes the address on every call and the
+# same wallet addresses recur across requests (and across the entries of one reserved list), so
+# cache the parse.  Returns the 20 raw bytes on success or the failure reason as a str; failures
+# are returned rather than raised so lru_cache remembers them too.
+@lru_cache(maxsize=16384)
+def _parse_eth_addr(v):
+    if not _eth_pattern.fullmatch(v):
+        return "not an ETH address"
+    if not eth_utils.is_address(v):
+        return "ETH address checksum failed"
+    return bytes.fromhex(v[2:])
+
+
 def raw_eth_addr(k, v):
-    if re.fullmatch(eth_regex, v):
-        if not eth_utils.is_address(v):
-            raise ParseError(k, "ETH address checksum failed")
-        return bytes.fromhex(v[2:])
-    raise ParseError(k, "not an ETH address")
+    result = _parse_eth_addr(v)
+    if isinstance(result, bytes):
+        return result
+    raise ParseError(k, result)
+
+
+# The EIP-55 checksumming does a keccak256 per call and the same operator/contributor addresses
+# recur across nodes and across refresh cycles, so memoize it: one hash per unique address rather
+# than one per (node, address) pair.
+@lru_cache(maxsize=131072)
+def _eth_format_cached(addr: Union[bytes, str]) -> str:
+    return eth_utils.to_checksum_address(addr)
 
 
 def eth_format(addr: Union[bytes, str]):
+    if isinstance(addr, str):
+        addr = addr.lower()  # normalize so differently-cased copies share a cache entry
     try:
-        return eth_utils.to_checksum_address(addr)
+        return _eth_format_cached(addr)
     except ValueError:
         raise ParseError("Invalid ETH address")
 
@@ -696,6 +866,30 @@ class SNSignatureValidationError(ValueError):
     pass
 
 
+# The signature verification is the expensive part of registration validation and the same payload
+# is regularly re-submitted (UI retries, a /validate followed by a /store of the same values), so
+# remember recent verdicts keyed by the key/sig bytes.  Returns the failure message, or None if the
+# signatures are valid; results (including failures) are returned rather than raised so lru_cache
+# caches them.
+@lru_cache(maxsize=4096)
+def _check_reg_sigs_cached(pubkey_ed25519, pubkey_bls, sig_ed25519, sig_bls):
+    signed = pubkey_ed25519 + pubkey_bls
+
+    # Call the libsodium verification directly rather than constructing a throwaway VerifyKey
+    # wrapper per call.  (libsodium's batch verification API is not exposed by PyNaCl, so each
+    # registration is still verified individually.)
+    try:
+        sodium.crypto_sign_open(sig_ed25519 + signed, pubkey_ed25519)
+    except nacl.exceptions.BadSignatureError:
+        return "Ed25519 signature is invalid"
+
+    # FIXME: BLS verification of pubkey_bls on signed
+    if False:
+        return "BLS signature is invalid"
+
+    return None
+
+
 def check_reg_keys_sigs(params):
     if len(
         params["pubkey_ed25519"]
@@ -709,19 +903,11 @@ def check_reg_keys_sigs(params):
     if contract is not None and len(contract) != 20:
         raise SNSignatureValidationError("contract address is invalid")
 
-    signed = (
-        params["pubkey_ed25519"]
-        + params["pubkey_bls"]
+    error = _check_reg_sigs_cached(
+        params["pubkey_ed25519"], params["pubkey_bls"], params["sig_ed25519"], params["sig_bls"]
     )
-
-    try:
-        VerifyKey(params["pubkey_ed25519"]).verify(signed, params["sig_ed25519"])
-    except nacl.exceptions.BadSignatureError:
-        raise SNSignatureValidationError("Ed25519 signature is invalid")
-
-    # FIXME: BLS verification of pubkey_bls on signed
-    if False:
-        raise SNSignatureValidationError("BLS signature is invalid")
+    if error is not None:
+        raise SNSignatureValidationError(error)
 
 
 class ParseError(ValueError):
@@ -805,6 +991,34 @@ def parse_query_params(params: dict[str, Callable[[str, str], Any]]):
     return parsed
 
 
+# Query parameter schemas for the registration endpoints, built once at import instead of
+# reconstructing the dict (and the byte_decoder closures) on every request.
+_store_registration_schema = {
+    "pubkey_bls": byte_decoder(64),
+    "sig_ed25519": byte_decoder(64),
+    "sig_bls": byte_decoder(128),
+    "-contract": raw_eth_addr,
+    "operator": raw_eth_addr,
+}
+
+# The closed set of signature-related parameter names, used to classify ParseErrors from the
+# schema above with one hash lookup instead of two prefix scans.
+_signature_fields = frozenset(("pubkey_ed25519", "pubkey_bls", "sig_ed25519", "sig_bls"))
+
+_validate_registration_schema = {
+    "pubkey_ed25519": byte_decoder(32),
+    "pubkey_bls": byte_decoder(64),
+    "sig_ed25519": byte_decoder(64),
+    "sig_bls": byte_decoder(128),
+    "-contract": raw_eth_addr,
+    "operator": raw_eth_addr,
+    "stake": parse_currency,
+    "-res_addr[]": None,
+    "-res_stake[]": None,
+    "-fee": None,
+}
+
+
 @app.route("/store/<hex64:sn_pubkey>", methods=["GET", "POST"])
 def store_registration(sn_pubkey: bytes):
     """
@@ -826,15 +1040,7 @@ def store_registration(sn_pubkey: bytes):
     """
 
     try:
-        params = parse_query_params(
-            {
-                "pubkey_bls": byte_decoder(64),
-                "sig_ed25519": byte_decoder(64),
-                "sig_bls": byte_decoder(128),
-                "-contract": raw_eth_addr,
-                "operator": raw_eth_addr,
-            }
-        )
+        params = parse_query_params(_store_registration_schema)
 
         params["pubkey_ed25519"] = sn_pubkey
 
@@ -921,8 +1127,8 @@ def sn_pubkey_registrations(sn_pubkey: bytes) -> flask.Response:
     result = json_response({"registrations": reg_array})
     return result
 
-@app.route("/registrations/<eth_wallet:operator>")
-def operator_registrations(operator: str):
+@app.route("/registrations/<eth_wallet_bytes:operator>")
+def operator_registrations(operator: bytes):
     """
     Retrieves stored registration(s) for the given 'operator'.
 
@@ -934,8 +1140,8 @@ def operator_registrations(operator: str):
     Returns the JSON response with the 'registrations' for the given 'operator'.
     """
 
-    reg_array      = []
-    operator_bytes = bytes.fromhex(operator[2:])
+    reg_array    = []
+    operator_str = eth_format(operator)
 
     with get_sql() as sql:
         cur = sql.cursor()
@@ -946,7 +1152,7 @@ def operator_registrations(operator: str):
             WHERE operator = ?
             ORDER BY timestamp DESC
             """,
-            (operator_bytes,),
+            (operator,),
         )
         for pubkey_ed25519, pubkey_bls, sig_ed25519, sig_bls, contract, timestamp in cur:
             reg_array.append({
@@ -955,7 +1161,7 @@ def operator_registrations(operator: str):
                 "pubkey_bls":     pubkey_bls,
                 "sig_ed25519":    sig_ed25519,
                 "sig_bls":        sig_bls,
-                "operator":       operator,
+                "operator":       operator_str,
                 "timestamp":      timestamp,
                 "contract":       "" if contract is None else contract,
             })
@@ -971,21 +1177,22 @@ def check_stakes(stakes, total, stakers, max_stakers):
         raise ValueError(f"at least one s/S value pair is required")
     if len(stakers) > max_stakers:
         raise ValueError(f"too many stakers ({len(stakers)} > {max_stakers})")
-    if sum(stakes) > total:
-        raise ValueError(f"total stake is too large ({sum(stakes)} > total)")
+    staked = sum(stakes)
+    if staked > total:
+        raise ValueError(f"total stake is too large ({staked} > total)")
     if len(set(stakers)) != len(stakers):
         raise ValueError(f"duplicate staking addresses in staker list")
 
     remaining_stake = total
     remaining_spots = max_stakers
 
-    for i in range(len(stakes)):
+    for i, stake in enumerate(stakes):
         reqd = remaining_stake // (4 if i == 0 else remaining_spots)
-        if stakes[i] < reqd:
+        if stake < reqd:
             raise ValueError(
-                "reserved stake [i] ({stakers[i]}) is too low ({stakes[i]} < {reqd})"
+                f"reserved stake [{i}] ({stakers[i]}) is too low ({stake} < {reqd})"
             )
-        remaining_stake -= stakes[i]
+        remaining_stake -= stake
         remaining_spots -= 1
 
 def format_currency(units: int, decimal: int = 9):
@@ -994,7 +1201,6 @@ def format_currency(units: int, decimal: int = 9):
     it does not use floating point math or involve any truncation or rounding
     """
     base = 10**decimal
-    print(f"units: {units}, base: {base}, decimal: {decimal}, {units//base}")
     frac = units % base
     frac = "" if frac == 0 else f".{frac:0{decimal}d}".rstrip("0")
     return f"{units // base}{frac}"
@@ -1021,6 +1227,51 @@ def parse_currency(k, val: str, decimal: int = 9):
     return whole * 10**decimal + frac
 
 
+# Preformatted stake constants for the error message templates below; MAX_STAKE/MIN_OP_STAKE never
+# change at runtime (and the error call sites always pass them), so format once at import.
+_max_stake_fmt    = format_currency(MAX_STAKE)
+_min_op_stake_fmt = format_currency(MIN_OP_STAKE)
+_min_op_pct       = MIN_OP_STAKE / MAX_STAKE * 100
+
+# Message templates for `error_response`, keyed by error code.  Templates containing placeholders
+# are formatted with str.format_map over the error parameters; values needing preformatting
+# (currency amounts) are supplied by the matching callable in `_error_format_args`, invoked only
+# when that code is actually hit.
+_error_messages = {
+    "bad_request":            "Invalid request parameters",
+    "invalid_op_addr":        "Invalid operator address",
+    "invalid_op_stake":       "Invalid/unparseable operator stake",
+    # For a solo node that doesn't contribute the exact requirement:
+    "wrong_op_stake":         f"Invalid operator stake: exactly {_max_stake_fmt} {TOKEN_NAME} is required for a solo node",
+    "insufficient_op_stake":  f"Insufficient operator stake: at least {_min_op_stake_fmt} ({_min_op_pct}%) is required",
+    "invalid_contract_addr":  "Invalid contract address",
+    "invalid_res_addr":       "Invalid reserved contributor address {index}: {address}",
+    "invalid_res_stake":      "Invalid/unparseable reserved contributor amount for contributor {index} ({address})",
+    "insufficient_res_stake": "Insufficient reserved contributor stake: contributor {index} ({address}) must contribute at least {minimum_fmt}",
+    # For multi-contributor (a solo node would get wrong_op_stake instead):
+    "too_much":               "Total node reserved contributions are too large: {total_fmt} exceeds the maximum stake " + _max_stake_fmt,
+    "too_many":               "Too many reserved contributors: only {max_contributors} contributor spots are possible",
+    "invalid_fee":            "Invalid fee",
+    "signature":              "Invalid service node registration pubkeys/signatures",
+}
+
+_error_format_args = {
+    "insufficient_res_stake": lambda err: {"minimum_fmt": format_currency(err["minimum"])},
+    "too_much":               lambda err: {"total_fmt": format_currency(err["total"])},
+}
+
+
+# Fully-constant error dicts -- codes whose message has no placeholders, reported with no extra
+# parameters -- built once at import so those error paths do no per-request formatting.  (The
+# response body itself can't be pre-serialized since json_response stamps in fresh network/t
+# values.)
+_static_errors = {
+    code: {"code": code, "error": msg}
+    for code, msg in _error_messages.items()
+    if "{" not in msg
+}
+
+
 def error_response(code, **err):
     """
     Error codes that can be returned to a client when validating registration details.  The `code`
@@ -1035,44 +1286,130 @@ def error_response(code, **err):
     {detail}" appended to it (the detail will also be passed along separately).
     """
 
-    err["code"] = code
-    match code:
-        case "bad_request":
-            msg = "Invalid request parameters"
-        case "invalid_op_addr":
-            msg = "Invalid operator address"
-        case "invalid_op_stake":
-            msg = "Invalid/unparseable operator stake"
-        case "wrong_op_stake":
-            # For a solo node that doesn't contribute the exact requirement
-            msg = f"Invalid operator stake: exactly {format_currency(err['required'])} {TOKEN_NAME} is required for a solo node"
-        case "insufficient_op_stake":
-            msg = f"Insufficient operator stake: at least {format_currency(err['minimum'])} ({err['minimum'] / MAX_STAKE * 100}%) is required"
-        case "invalid_contract_addr":
-            msg = "Invalid contract address"
-        case "invalid_res_addr":
-            msg = f"Invalid reserved contributor address {err['index']}: {err['address']}"
-        case "invalid_res_stake":
-            msg = f"Invalid/unparseable reserved contributor amount for contributor {err['index']} ({err['address']})"
-        case "insufficient_res_stake":
-            msg = f"Insufficient reserved contributor stake: contributor {err['index']} ({err['address']}) must contribute at least {format_currency(err['minimum'])}"
-        case "too_much":
-            # for multi-contributor (solo node would get wrong_op_stake instead)
-            msg = f"Total node reserved contributions are too large: {format_currency(err['total'])} exceeds the maximum stake {format_currency(err['maximum'])}"
-        case "too_many":
-            msg = f"Too many reserved contributors: only {err['max_contributors']} contributor spots are possible"
-        case "invalid_fee":
-            msg = "Invalid fee"
-        case "signature":
-            msg = "Invalid service node registration pubkeys/signatures"
-        case _:
-            msg = None
+    if not err:
+        static = _static_errors.get(code)
+        if static is not None:
+            return json_response({"error": static})
+
+    msg = _error_messages.get(code)
+    if msg is not None and "{" in msg:
+        fmt_args = _error_format_args.get(code)
+        msg = msg.format_map({**err, **fmt_args(err)} if fmt_args else err)
 
+    err["code"]  = code
     err["error"] = f"{msg}: {err['detail']}" if "detail" in err else msg
 
     return json_response({"error": err})
 
 
+def _validate_solo(params):
+    """Solo-node half of `validate_registration`: no reserved spots or fee are allowed, and the
+    operator stake must be exactly the staking requirement."""
+
+    if params["res_addr"] or params["res_stake"]:
+        return error_response(
+            "invalid_contract_addr",
+            detail="the contract address is required for multi-contributor registrations",
+        )
+
+    if "fee" in params:
+        return error_response(
+            "invalid_fee", detail="fee is not applicable to a solo node registration"
+        )
+
+    if params["stake"] != MAX_STAKE:
+        return error_response(
+            "wrong_op_stake", stake=params["stake"], required=MAX_STAKE
+        )
+
+    return json_response({"success": True})
+
+
+def _validate_multi(params):
+    """Multi-contribution half of `validate_registration`: validates the fee, the reserved
+    contributor list, and the operator/reserved stake minimums."""
+
+    if "fee" not in params:
+        return error_response(
+            "invalid_fee",
+            detail="fee is required for a multi-contribution registration",
+        )
+    fee = params["fee"]
+    fee = int(fee) if fee.isdecimal() else -1
+    if not 0 <= fee <= 10000:
+        return error_response(
+            "invalid_fee",
+            detail="fee must be an integer between 0 and 10000 (= 100.00%)",
+        )
+
+    res_addr  = params["res_addr"]
+    res_stake = params["res_stake"]
+    if len(res_addr) != len(res_stake):
+        return error_response(
+            "bad_request",
+            field="res_addr",
+            detail="mismatched reserved address/stake lists",
+        )
+
+    # Parallel arrays rather than a list of (addr, amount) tuples; the stake arithmetic below only
+    # needs the amounts, with the address looked up just for error reporting.  (The final lengths
+    # are known up front, but the loop has to be able to bail out with the failing index, which
+    # rules out building these as comprehensions.)
+    reserved_addrs = []
+    reserved_amts = []
+    total_reserved = params["stake"]
+    for i, (addr, stake) in enumerate(zip(res_addr, res_stake)):
+        try:
+            eth = raw_eth_addr("res_addr", addr)
+        except ValueError:
+            return error_response("invalid_res_addr", address=eth_format(addr), index=i+1)
+        try:
+            amt = parse_currency("res_stake", stake)
+        except ValueError:
+            return error_response(
+                "invalid_res_stake", address=eth_format(addr), index=i+1
+            )
+
+        reserved_addrs.append(eth)
+        reserved_amts.append(amt)
+        total_reserved += amt
+
+    if params["stake"] < MIN_OP_STAKE:
+        return error_response(
+            "insufficient_op_stake", stake=params["stake"], minimum=MIN_OP_STAKE
+        )
+    if total_reserved > MAX_STAKE:
+        return error_response("too_much", total=total_reserved, maximum=MAX_STAKE)
+    if 1 + len(reserved_amts) > MAX_STAKERS:
+        return error_response("too_many", max_contributors=MAX_STAKERS - 1)
+
+    remaining_stake = MAX_STAKE - params["stake"]
+    remaining_spots = MAX_STAKERS - 1
+
+    for i, amt in enumerate(reserved_amts):
+        # integer math ceiling via -(-a // b); the last spot needs no division at all:
+        if remaining_spots == 1:
+            min_contr = remaining_stake
+        else:
+            min_contr = -(-remaining_stake // remaining_spots)
+        if amt < min_contr:
+            return error_response(
+                "insufficient_res_stake",
+                index=i+1,
+                address=eth_format(reserved_addrs[i]),
+                minimum=min_contr,
+            )
+        remaining_stake -= amt
+        remaining_spots -= 1
+
+    return json_response({
+        "success": True,
+        "remaining_contribution": remaining_stake,
+        "remaining_spots": remaining_spots,
+        "remaining_min_contribution": -(-remaining_stake // remaining_spots),
+    })
+
+
 @app.route("/validate")
 def validate_registration():
     """
@@ -1102,30 +1439,14 @@ def validate_registration():
     indicating the error that was detected.  See `error_response` for details.
     """
 
-    stakers = []
-    stakes = []
-
     try:
-        params = parse_query_params(
-            {
-                "pubkey_ed25519": byte_decoder(32),
-                "pubkey_bls": byte_decoder(64),
-                "sig_ed25519": byte_decoder(64),
-                "sig_bls": byte_decoder(128),
-                "-contract": raw_eth_addr,
-                "operator": raw_eth_addr,
-                "stake": parse_currency,
-                "-res_addr[]": None,
-                "-res_stake[]": None,
-                "-fee": None,
-            }
-        )
+        params = parse_query_params(_validate_registration_schema)
     except (ParseMissingError, ParseUnknownError, ParseMultipleError) as e:
         return error_response("bad_request", field=e.field, detail=str(e))
     except ParseError as e:
         code = None
         match e.field:
-            case f if f.startswith("pubkey_") or f.startswith("sig_"):
+            case f if f in _signature_fields:
                 return error_response("signature", field=f, detail=str(e))
             case "operator":
                 return error_response("invalid_op_addr", detail=str(e))
@@ -1141,96 +1462,11 @@ def validate_registration():
     except SNSignatureValidationError as e:
         return error_response("signature", detail=str(e))
 
-    solo = "contract" not in params
-
     for k in ("addr", "stake"):
         params.setdefault(f"res_{k}", [])
 
-    if solo and params["res_addr"]:
-        return error_response(
-            "invalid_contract_addr",
-            detail="the contract address is required for multi-contributor registrations",
-        )
-
-    if solo and "fee" in params:
-        return error_response(
-            "invalid_fee", detail="fee is not applicable to a solo node registration"
-        )
-    elif "fee" not in params:
-        return error_response(
-            "invalid_fee",
-            detail="fee is required for a multi-contribution registration",
-        )
-    else:
-        fee = params["fee"]
-        fee = int(fee) if re.fullmatch(r"\d+", fee) else -1
-        if not 0 <= fee <= 10000:
-            return error_response(
-                "invalid_fee",
-                detail="fee must be an integer between 0 and 10000 (= 100.00%)",
-            )
-
-    if len(params["res_addr"]) != len(params["res_stake"]):
-        return error_response(
-            "bad_request",
-            field="res_addr",
-            detail="mismatched reserved address/stake lists",
-        )
-
-    reserved = []
-    for i, (addr, stake) in enumerate(zip(params["res_addr"], params["res_stake"])):
-        try:
-            eth = raw_eth_addr("res_addr", addr)
-        except ValueError:
-            return error_response("invalid_res_addr", address=eth_format(addr), index=i+1)
-        try:
-            amt = parse_currency("res_stake", stake)
-        except ValueError:
-            return error_response(
-                "invalid_res_stake", address=eth_format(addr), index=i+1
-            )
-
-        reserved.append((eth, amt))
-
-    total_reserved = params["stake"] + sum(stake for _, stake in reserved)
-    if solo:
-        if total_reserved != MAX_STAKE:
-            return error_response(
-                "wrong_op_stake", stake=total_reserved, required=MAX_STAKE
-            )
-    else:
-        if params["stake"] < MIN_OP_STAKE:
-            return error_response(
-                "insufficient_op_stake", stake=params["stake"], minimum=MIN_OP_STAKE
-            )
-        if total_reserved > MAX_STAKE:
-            return error_response("too_much", total=total_reserved, maximum=MAX_STAKE)
-        if 1 + len(reserved) > MAX_STAKERS:
-            return error_response("too_many", max_contributors=MAX_STAKERS - 1)
-
-        remaining_stake = MAX_STAKE - params["stake"]
-        remaining_spots = MAX_STAKERS - 1
-
-        for i, (addr, amt) in enumerate(reserved):
-            # integer math ceiling:
-            min_contr = (remaining_stake + remaining_spots - 1) // remaining_spots
-            if amt < min_contr:
-                return error_response(
-                    "insufficient_res_stake",
-                    index=i+1,
-                    address=eth_format(addr),
-                    minimum=min_contr,
-                )
-            remaining_stake -= amt
-            remaining_spots -= 1
-
-    res = {"success": True}
-
-    if not solo:
-        res["remaining_contribution"] = remaining_stake
-        res["remaining_spots"] = remaining_spots
-        res["remaining_min_contribution"] = (
-            remaining_stake + remaining_spots - 1
-        ) // remaining_spots
-
-    return json_response(res)
+    # Dispatch once on the registration type; the two specialized handlers each run only their
+    # own checks rather than re-testing solo-ness at every step.
+    if "contract" not in params:
+        return _validate_solo(params)
+    return _validate_multi(params)